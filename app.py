@@ -1,28 +1,27 @@
  (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
 diff --git a//dev/null b/app.py
-index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b8194c6b5892 100644
+index 0000000000000000000000000000000000000000..8321881f554fa4f71f38ccb1c0df33be5777e160 100644
 --- a//dev/null
 +++ b/app.py
-@@ -0,0 +1,220 @@
+@@ -0,0 +1,291 @@
 +"""Streamlit application for comparing XRP and BTC performance."""
 +from __future__ import annotations
 +
-+import time
-+import zipfile
++import os
++import tempfile
 +from datetime import date
-+from io import BytesIO
 +from pathlib import Path
-+from typing import Dict, Optional
++from typing import Dict, Hashable, Mapping, Optional
 +
 +import pandas as pd
 +import streamlit as st
 +
-+from core.charts import plot_drawdown, plot_indexed_growth, plot_ratio, plot_zscores
-+from core.compute import compute
-+from core.data_source import fetch_market_chart
++from core.compute import compute_window
++from core.data_source import load_market_data, sync_timeseries_store
++from core.result_store import ResultStore
 +
 +EXPORT_DIR = Path("exports")
-+EXPORT_DIR.mkdir(parents=True, exist_ok=True)
++COINS = ("bitcoin", "ripple")
 +
 +
 +st.set_page_config(page_title="XRP vs BTC Analysis", layout="wide")
@@ -31,34 +30,37 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +
 +
 +@st.cache_data(show_spinner=False, ttl=60 * 60 * 24)
-+def load_coin_data(coin_id: str) -> pd.DataFrame:
-+    return fetch_market_chart(coin_id)
++def load_coverage(coin_ids: tuple[str, ...]) -> Dict[str, tuple]:
++    """Sync the local time-series store and return each coin's date coverage."""
 +
++    store = sync_timeseries_store(coin_ids)
++    coverage = {}
++    for coin_id in coin_ids:
++        span = store.coverage(coin_id)
++        if span is None:
++            raise ValueError(f"No price data stored for {coin_id}")
++        coverage[coin_id] = (*span, store.updated_at(coin_id))
++    return coverage
 +
-+def determine_overlap(
-+    btc_df: pd.DataFrame, xrp_df: pd.DataFrame
-+) -> tuple[date, date]:
-+    start = max(btc_df["date"].min(), xrp_df["date"].min()).date()
-+    end = min(btc_df["date"].max(), xrp_df["date"].max()).date()
++
++@st.cache_resource
++def get_result_store() -> ResultStore:
++    return ResultStore()
++
++
++def determine_overlap(coverage: Mapping[str, tuple]) -> tuple[date, date]:
++    start = max(span[0] for span in coverage.values()).date()
++    end = min(span[1] for span in coverage.values()).date()
 +    return start, end
 +
 +
-+if "results_df" not in st.session_state:
-+    st.session_state["results_df"] = None
-+if "summary" not in st.session_state:
-+    st.session_state["summary"] = None
++result_store = get_result_store()
++
++if "result_key" not in st.session_state:
++    st.session_state["result_key"] = None
 +
 +with st.sidebar:
 +    st.header("Controls")
-+    try:
-+        btc_raw = load_coin_data("bitcoin")
-+        time.sleep(1.05)
-+        xrp_raw = load_coin_data("ripple")
-+    except Exception as exc:  # pragma: no cover - UI handling
-+        st.error(f"Failed to load initial data: {exc}")
-+        st.stop()
-+
-+    overlap_start, overlap_end = determine_overlap(btc_raw, xrp_raw)
 +
 +    frequency_label = st.selectbox(
 +        "Frequency",
@@ -83,6 +85,18 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +
 +    include_drawdown = st.checkbox("Include drawdown chart", value=False)
 +
++    # Load price history only after the controls above have been sent to the
++    # browser. The sidebar needs only each coin's date coverage from the local
++    # store; the history itself is read per window when computing.
++    with st.spinner("Loading price history..."):
++        try:
++            coverage = load_coverage(COINS)
++        except Exception as exc:  # pragma: no cover - UI handling
++            st.error(f"Failed to load initial data: {exc}")
++            st.stop()
++
++    overlap_start, overlap_end = determine_overlap(coverage)
++
 +    rebase_date_input = st.date_input(
 +        "Rebase date",
 +        value=overlap_start,
@@ -93,26 +107,61 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +    fetch_button = st.button("Fetch & Compute", use_container_width=True)
 +
 +if fetch_button:
-+    with st.spinner("Fetching data and computing metrics..."):
-+        try:
-+            results_df, summary = compute(
-+                btc_raw,
-+                xrp_raw,
-+                frequency=frequency,
-+                rebase_date=pd.Timestamp(rebase_date_input),
-+                z_log=z_log,
-+                rolling_days=rolling_days,
-+                include_drawdown=include_drawdown,
-+            )
-+            st.session_state["results_df"] = results_df
-+            st.session_state["summary"] = summary
-+        except Exception as exc:  # pragma: no cover - UI handling
-+            st.error(f"Error during computation: {exc}")
-+
-+results_df: Optional[pd.DataFrame] = st.session_state.get("results_df")
-+summary: Optional[Dict[str, object]] = st.session_state.get("summary")
++    st.session_state["result_request"] = {
++        "frequency": frequency,
++        "rebase_date": rebase_date_input.isoformat(),
++        "z_log": z_log,
++        "rolling_days": rolling_days,
++        "include_drawdown": include_drawdown,
++        "coverage": tuple(coverage[coin_id] for coin_id in COINS),
++    }
++    st.session_state["result_key"] = None
++
++result_request: Optional[Dict[str, object]] = st.session_state.get("result_request")
++result_key: Optional[Hashable] = st.session_state.get("result_key")
++results_df: Optional[pd.DataFrame] = None
++summary: Optional[Mapping[str, object]] = None
++
++if result_request is not None:
++    # Sessions keep only the request and its key; identical requests from any
++    # session share the single read-only result held by the process-wide store.
++    # A key evicted from the store since the last run is simply recomputed.
++    request_key = tuple(result_request.values())
++    if result_key is None:
++        spinner_text = "Fetching data and computing metrics..."
++    else:
++        spinner_text = "Cached result expired; recomputing..."
++    if request_key not in result_store or result_key is None:
++        with st.spinner(spinner_text):
++            try:
++                result_key = result_store.get_or_compute(
++                    request_key,
++                    lambda: compute_window(
++                        load_market_data,
++                        coins=COINS,
++                        frequency=result_request["frequency"],
++                        rebase_date=pd.Timestamp(result_request["rebase_date"]),
++                        z_log=result_request["z_log"],
++                        rolling_days=result_request["rolling_days"],
++                        include_drawdown=result_request["include_drawdown"],
++                    ),
++                )
++            except Exception as exc:  # pragma: no cover - UI handling
++                st.error(f"Error during computation: {exc}")
++                st.session_state["result_request"] = None
++                result_key = None
++        st.session_state["result_key"] = result_key
++
++if result_key is not None:
++    results_df = result_store.frame(result_key)
++    summary = result_store.summary(result_key)
++    if results_df is None or summary is None:
++        st.warning("This result expired from the shared cache. Click 'Fetch & Compute' again.")
 +
 +if results_df is not None and summary is not None:
++    from core.charts import plot_drawdown, plot_indexed_growth, plot_ratio, plot_zscores
++    from core.export import write_columnar, write_csv, write_zip
++
 +    st.subheader("Summary")
 +    cols = st.columns(3)
 +    start_dt = summary["start_date"]
@@ -141,7 +190,7 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +
 +    st.markdown("---")
 +
-+    chart_df = results_df.copy()
++    chart_df = results_df
 +    fig_index = plot_indexed_growth(chart_df, save=False)
 +    st.pyplot(fig_index)
 +
@@ -158,24 +207,7 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +    st.subheader("Data Preview")
 +    st.dataframe(chart_df.tail(200), use_container_width=True)
 +
-+    export_col1, export_col2 = st.columns(2)
-+
-+    csv_bytes = chart_df.to_csv(index=False).encode("utf-8")
-+    csv_path = EXPORT_DIR / "xrp_btc_full_series.csv"
-+    csv_path.write_bytes(csv_bytes)
-+    export_col1.download_button(
-+        "Download CSV",
-+        data=csv_bytes,
-+        file_name="xrp_btc_full_series.csv",
-+        mime="text/csv",
-+        use_container_width=True,
-+    )
-+
-+    plot_indexed_growth(chart_df, save=True)
-+    plot_ratio(chart_df, save=True)
-+    plot_zscores(chart_df, save=True)
-+    if include_drawdown:
-+        plot_drawdown(chart_df, save=True)
++    export_col1, export_col2, export_col3 = st.columns(3)
 +
 +    summary_lines = [
 +        "XRP vs BTC Summary",
@@ -192,8 +224,6 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +        f"Z-Scores via Log Prices: {'Yes' if z_log else 'No'}",
 +    ]
 +    summary_text = "\n".join(summary_lines)
-+    summary_path = EXPORT_DIR / "summary.txt"
-+    summary_path.write_text(summary_text, encoding="utf-8")
 +
 +    chart_files = {
 +        "01_indexed_growth.png": fig_index,
@@ -203,25 +233,66 @@ index 0000000000000000000000000000000000000000..e90c1683603039531249c486eac4b819
 +    if include_drawdown and drawdown_fig is not None:
 +        chart_files["04_drawdowns.png"] = drawdown_fig
 +
-+    zip_buffer = BytesIO()
-+    with zipfile.ZipFile(zip_buffer, "w") as archive:
++    # Every run builds its artifacts in a private directory, so concurrent sessions
++    # never see each other's half-written files. The finished files are then moved
++    # into exports/ atomically. The download buttons read them from there only when
++    # clicked, so nothing is held in memory between reruns; a click serves the most
++    # recent complete export.
++    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
++    with tempfile.TemporaryDirectory(dir=EXPORT_DIR, prefix=".run-") as run_name:
++        run_dir = Path(run_name)
++
++        csv_path = run_dir / "xrp_btc_full_series.csv"
++        write_csv(chart_df, csv_path)
 +        for filename, figure in chart_files.items():
-+            image_buffer = BytesIO()
-+            figure.savefig(image_buffer, format="png", dpi=150)
-+            archive.writestr(filename, image_buffer.getvalue())
-+        archive.writestr("summary.txt", summary_text)
-+        archive.writestr("xrp_btc_full_series.csv", csv_bytes)
-+    zip_buffer.seek(0)
++            figure.savefig(run_dir / filename, dpi=150)
++        (run_dir / "summary.txt").write_text(summary_text, encoding="utf-8")
 +
++        archive_names = [*chart_files, "summary.txt", csv_path.name]
++        zip_path = write_zip(
++            run_dir / "xrp_btc_artifacts.zip",
++            files={name: run_dir / name for name in archive_names},
++        )
++        columnar_path = write_columnar(chart_df, run_dir / "xrp_btc_full_series")
++
++        for artifact in run_dir.iterdir():
++            os.replace(artifact, EXPORT_DIR / artifact.name)
++
++    csv_path = EXPORT_DIR / csv_path.name
++    export_col1.download_button(
++        "Download CSV",
++        data=csv_path.read_bytes,
++        file_name=csv_path.name,
++        mime="text/csv",
++        use_container_width=True,
++    )
++
++    zip_path = EXPORT_DIR / zip_path.name
 +    export_col2.download_button(
 +        "Download Charts & Summary (ZIP)",
-+        data=zip_buffer.getvalue(),
-+        file_name="xrp_btc_artifacts.zip",
++        data=zip_path.read_bytes,
++        file_name=zip_path.name,
 +        mime="application/zip",
 +        use_container_width=True,
 +    )
 +
++    columnar_path = EXPORT_DIR / columnar_path.name
++    export_col3.download_button(
++        f"Download {columnar_path.suffix.lstrip('.').upper()}",
++        data=columnar_path.read_bytes,
++        file_name=columnar_path.name,
++        mime="application/octet-stream",
++        use_container_width=True,
++    )
++
 +    st.caption("Artifacts are saved to the exports/ directory and available for download above.")
++
++    with st.expander("Shared result store memory"):
++        st.caption(
++            f"{len(result_store)} cached result(s), "
++            f"{result_store.total_bytes() / 1024 ** 2:.2f} MiB shared by all sessions."
++        )
++        st.dataframe(result_store.memory_usage(), use_container_width=True)
 +else:
 +    st.info("Use the sidebar controls and click 'Fetch & Compute' to load the analysis.")
  
@@ -0,0 +1,151 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/benchmarks/cold_start.py
+index 0000000000000000000000000000000000000000..73db43e22ae2de777555419ad699368ce9c99460 100644
+--- a//dev/null
++++ b/benchmarks/cold_start.py
+@@ -0,0 +1,142 @@
++"""Measure module import cost and time to first render of the Streamlit app.
++
++Run from the repository root::
++
++    python benchmarks/cold_start.py
++
++Each import is timed in a fresh interpreter so results reflect a cold start.
++The render measurements run ``app.py`` headlessly through Streamlit's
++``AppTest`` against synthetic cached payloads, so no network access is needed:
++once with the data load stopped (how fast the sidebar controls appear) and
++once in full.
++"""
++from __future__ import annotations
++
++import argparse
++import json
++import os
++import statistics
++import subprocess
++import sys
++import tempfile
++import time
++from pathlib import Path
++
++REPO_ROOT = Path(__file__).resolve().parents[1]
++HEAVY_MODULES = ["matplotlib.pyplot", "requests"]
++IMPORT_TARGETS = ["core.compute", "core.data_source", "core.charts"]
++
++
++def _time_import(module: str, cwd: Path) -> dict:
++    script = (
++        "import json, sys, time\n"
++        "start = time.perf_counter()\n"
++        f"import {module}\n"
++        "elapsed = time.perf_counter() - start\n"
++        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
++        "print(json.dumps({'seconds': elapsed, 'heavy': heavy}))\n"
++    )
++    output = subprocess.check_output(
++        [sys.executable, "-c", script],
++        cwd=cwd,
++        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
++        text=True,
++    )
++    return json.loads(output)
++
++
++def _write_synthetic_cache(cache_dir: Path, days: int) -> None:
++    cache_dir.mkdir(parents=True, exist_ok=True)
++    start_ms = 1_388_534_400_000  # 2014-01-01
++    day_ms = 86_400_000
++    for coin_id, base in (("bitcoin", 800.0), ("ripple", 0.02)):
++        prices = [[start_ms + i * day_ms, base * (1.0 + i / days)] for i in range(days)]
++        payload = {"prices": prices}
++        (cache_dir / f"cache_{coin_id}.json").write_text(json.dumps(payload))
++
++
++def _stop_at_data_load(*args: object, **kwargs: object) -> None:
++    import streamlit as st
++
++    st.stop()
++
++
++def _time_app_render(cwd: Path, days: int) -> dict | None:
++    """Time the sidebar controls and the full first render of ``app.py``.
++
++    ``AppTest.run()`` only returns once the script ends, so the controls are
++    timed in a separate run whose data load calls ``st.stop()``. The widgets
++    present at that point are the ones the browser sees before any data loads.
++    """
++
++    try:
++        from streamlit.testing.v1 import AppTest
++    except ImportError:
++        return None
++
++    from core import data_source
++
++    _write_synthetic_cache(cwd / "data", days)
++    previous = Path.cwd()
++    real_sync = data_source.sync_timeseries_store
++    os.chdir(cwd)
++    try:
++        data_source.sync_timeseries_store = _stop_at_data_load
++        # Warm-up run so one-off import costs are not charged to the controls.
++        AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=60).run()
++        controls_app = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=60)
++        start = time.perf_counter()
++        controls_app.run()
++        controls_elapsed = time.perf_counter() - start
++
++        data_source.sync_timeseries_store = real_sync
++        full_app = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=60)
++        start = time.perf_counter()
++        full_app.run()
++        full_elapsed = time.perf_counter() - start
++    finally:
++        data_source.sync_timeseries_store = real_sync
++        os.chdir(previous)
++    for app in (controls_app, full_app):
++        if app.exception:
++            raise RuntimeError(f"app.py raised during render: {app.exception}")
++    sidebar = controls_app.sidebar
++    return {
++        "controls_seconds": controls_elapsed,
++        "controls_before_data": len(sidebar.selectbox) + len(sidebar.checkbox),
++        "full_seconds": full_elapsed,
++    }
++
++
++def main() -> None:
++    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
++    parser.add_argument("--repeat", type=int, default=5, help="Import timing repetitions.")
++    parser.add_argument("--days", type=int, default=4000, help="Synthetic history length.")
++    args = parser.parse_args()
++
++    sys.path.insert(0, str(REPO_ROOT))
++    with tempfile.TemporaryDirectory() as tmp:
++        cwd = Path(tmp)
++        print(f"{'module':<20} {'median ms':>10}  heavy modules loaded")
++        for module in IMPORT_TARGETS:
++            runs = [_time_import(module, cwd) for _ in range(args.repeat)]
++            median_ms = statistics.median(run["seconds"] for run in runs) * 1000
++            heavy = ", ".join(runs[-1]["heavy"]) or "-"
++            print(f"{module:<20} {median_ms:>10.1f}  {heavy}")
++
++        created = sorted(p.name for p in cwd.iterdir())
++        print(f"directories created by imports: {', '.join(created) or '-'}")
++
++        render = _time_app_render(cwd, args.days)
++        if render is None:
++            print("app render: skipped (streamlit not installed)")
++        else:
++            print(
++                f"sidebar controls before data load: {render['controls_before_data']} "
++                f"widgets in {render['controls_seconds'] * 1000:.1f} ms"
++            )
++            print(f"full first render (warm disk cache): {render['full_seconds'] * 1000:.1f} ms")
++
++
++if __name__ == "__main__":
++    main()
+ 
+EOF
+)
@@ -0,0 +1,290 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/benchmarks/load_driver.py
+index 0000000000000000000000000000000000000000..2f5834687c44fb215785f5123cc7b8f4c0621095 100644
+--- a//dev/null
++++ b/benchmarks/load_driver.py
+@@ -0,0 +1,281 @@
++"""Concurrent load driver for the fetch -> store -> compute -> chart path.
++
++Starts ``benchmarks/mock_coingecko.py`` in-process, points ``core.data_source``
++at it and runs N virtual users concurrently. Each user either calls the core
++functions directly (``--mode core``: ``sync_timeseries_store`` then
++``compute_window`` over ``load_market_data``, as ``app.py`` does) or drives
++``app.py`` headlessly through Streamlit's ``AppTest`` (``--mode apptest``). Run
++from the repository root::
++
++    python benchmarks/load_driver.py --users 50 --iterations 5 --latency 0.2
++    python benchmarks/load_driver.py --users 20 --cache off --rate-limit-per-minute 30
++    python benchmarks/load_driver.py --mode apptest --users 10 --iterations 2
++
++Reports p50/p95/p99 latency per stage, throughput, errors and upstream call
++counts. All cache, store and export files go to a temporary directory. In core
++mode the ``chart`` stage includes time spent waiting for the shared chart lock.
++"""
++from __future__ import annotations
++
++import argparse
++import json
++import os
++import random
++import sys
++import tempfile
++import threading
++import time
++from collections import Counter
++from concurrent.futures import ThreadPoolExecutor
++from dataclasses import dataclass, field
++from pathlib import Path
++from typing import Dict, List, Optional
++
++import numpy as np
++import pandas as pd
++
++REPO_ROOT = Path(__file__).resolve().parents[1]
++sys.path.insert(0, str(REPO_ROOT))
++os.environ.setdefault("MPLBACKEND", "Agg")
++
++from benchmarks.mock_coingecko import MockCoinGecko  # noqa: E402
++from core import data_source  # noqa: E402
++from core.compute import compute_window  # noqa: E402
++
++COINS = ("bitcoin", "ripple")
++FREQUENCIES = ("D", "W", "M")
++PERCENTILES = (50, 95, 99)
++
++# pyplot keeps global figure state and is not thread-safe, so chart rendering
++# is serialized. This matches one Streamlit server rendering charts in-process.
++_CHART_LOCK = threading.Lock()
++
++
++@dataclass
++class Sample:
++    user: int
++    stages: Dict[str, float] = field(default_factory=dict)
++    error: Optional[str] = None
++
++
++def _cache_ttl_hours(cache_mode: str) -> int:
++    return 0 if cache_mode == "off" else 24
++
++
++def _render_charts(result) -> None:
++    import matplotlib.pyplot as plt
++
++    from core.charts import plot_drawdown, plot_indexed_growth, plot_ratio, plot_zscores
++
++    with _CHART_LOCK:
++        figures = [
++            plot_indexed_growth(result),
++            plot_ratio(result),
++            plot_zscores(result),
++            plot_drawdown(result),
++        ]
++        for figure in figures:
++            if figure is not None:
++                plt.close(figure)
++
++
++def _core_iteration(user: int, rng: random.Random, cache_mode: str) -> Sample:
++    """Run the app's data path: store sync, windowed load + compute, charts.
++
++    Mirrors ``app.py``: the store is synced with the mode's TTL (as
++    ``load_coverage`` does), a rebase date is drawn from the shared coverage and
++    ``compute_window`` reads only that window through ``load_market_data``.
++    """
++
++    sample = Sample(user=user)
++    load_seconds = []
++
++    def load_range(coins, start, end):
++        began = time.perf_counter()
++        frames = data_source.load_market_data(coins, start, end)
++        load_seconds.append(time.perf_counter() - began)
++        return frames
++
++    start = time.perf_counter()
++    try:
++        store = data_source.sync_timeseries_store(
++            COINS, cache_ttl_hours=_cache_ttl_hours(cache_mode)
++        )
++        spans = [store.coverage(coin) for coin in COINS]
++        first = max(span[0] for span in spans)
++        last = min(span[1] for span in spans)
++        synced = time.perf_counter()
++        result, _ = compute_window(
++            load_range,
++            coins=COINS,
++            frequency=rng.choice(FREQUENCIES),
++            rebase_date=first + pd.Timedelta(days=rng.randint(0, (last - first).days)),
++            rolling_days=rng.choice([None, 90, 365]),
++            include_drawdown=rng.random() < 0.5,
++        )
++        computed = time.perf_counter()
++        _render_charts(result)
++        charted = time.perf_counter()
++    except Exception as exc:
++        sample.error = type(exc).__name__
++        sample.stages["total"] = time.perf_counter() - start
++        return sample
++    sample.stages.update(
++        sync=synced - start,
++        load=sum(load_seconds),
++        compute=computed - synced - sum(load_seconds),
++        chart=charted - computed,
++        total=charted - start,
++    )
++    return sample
++
++
++def _apptest_iteration(user: int, rng: random.Random, cache_mode: str) -> Sample:
++    """Drive ``app.py`` through one render and one Fetch & Compute click.
++
++    The app applies its own cache TTLs, so ``cache_mode`` only shapes the
++    initial cache state prepared by :func:`main` (``off`` is rejected there).
++    """
++
++    from streamlit.testing.v1 import AppTest
++
++    sample = Sample(user=user)
++    start = time.perf_counter()
++    app = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=300)
++    app.run()
++    painted = time.perf_counter()
++    if not app.exception and not app.error:
++        app.selectbox[0].select(rng.choice(["Monthly", "Weekly", "Daily"]))
++        app.button[0].click().run()
++    finished = time.perf_counter()
++    if app.exception:
++        sample.error = "AppException"
++    elif app.error:
++        sample.error = "AppError"
++    sample.stages.update(
++        first_paint=painted - start,
++        compute_and_render=finished - painted,
++        total=finished - start,
++    )
++    return sample
++
++
++def _run_user(user: int, args: argparse.Namespace) -> List[Sample]:
++    rng = random.Random(args.seed + user)
++    iteration = _apptest_iteration if args.mode == "apptest" else _core_iteration
++    samples = []
++    for _ in range(args.iterations):
++        samples.append(iteration(user, rng, args.cache))
++        if args.think_time:
++            time.sleep(rng.uniform(0.0, args.think_time))
++    return samples
++
++
++def summarize(samples: List[Sample], wall_seconds: float, upstream: Dict[str, object]) -> Dict:
++    stage_names = sorted({name for sample in samples for name in sample.stages})
++    latency = {}
++    for name in stage_names:
++        values = np.array(
++            [s.stages[name] for s in samples if name in s.stages and s.error is None]
++        )
++        if values.size:
++            latency[name] = {
++                f"p{p}_ms": float(np.percentile(values, p) * 1000) for p in PERCENTILES
++            }
++    completed = sum(1 for s in samples if s.error is None)
++    return {
++        "iterations": len(samples),
++        "completed": completed,
++        "errors": dict(Counter(s.error for s in samples if s.error is not None)),
++        "wall_seconds": wall_seconds,
++        "throughput_per_second": completed / wall_seconds if wall_seconds else 0.0,
++        "latency": latency,
++        "upstream": upstream,
++    }
++
++
++def _print_report(report: Dict) -> None:
++    print(
++        f"iterations: {report['iterations']}  completed: {report['completed']}  "
++        f"wall: {report['wall_seconds']:.2f}s  "
++        f"throughput: {report['throughput_per_second']:.2f}/s"
++    )
++    if report["errors"]:
++        print(f"errors: {report['errors']}")
++    print(f"{'stage':<20}" + "".join(f"{f'p{p} ms':>12}" for p in PERCENTILES))
++    for name, values in report["latency"].items():
++        print(f"{name:<20}" + "".join(f"{values[f'p{p}_ms']:>12.1f}" for p in PERCENTILES))
++    upstream = report["upstream"]
++    print(
++        f"upstream calls: {upstream['calls']}  ok: {upstream['ok']}  "
++        f"429: {upstream['rate_limited']}  bytes: {upstream['bytes_sent']}  "
++        f"per coin: {upstream['per_coin']}"
++    )
++
++
++def main() -> None:
++    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
++    parser.add_argument("--mode", choices=["core", "apptest"], default="core")
++    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users.")
++    parser.add_argument("--iterations", type=int, default=3, help="Iterations per user.")
++    parser.add_argument("--think-time", type=float, default=0.0, help="Max pause between iterations (s).")
++    parser.add_argument(
++        "--cache",
++        choices=["cold", "warm", "off"],
++        default="cold",
++        help="cold: start with an empty cache; warm: prefill it; off: always hit upstream.",
++    )
++    parser.add_argument("--latency", type=float, default=0.1, help="Upstream latency (s).")
++    parser.add_argument("--jitter", type=float, default=0.05, help="Upstream latency jitter (s).")
++    parser.add_argument("--rate-limit-per-minute", type=int, default=None)
++    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
++    parser.add_argument("--days", type=int, default=4000, help="Upstream history length.")
++    parser.add_argument("--points-per-day", type=int, default=1, help="Upstream payload density.")
++    parser.add_argument(
++        "--client-sleep",
++        type=float,
++        default=data_source.DEFAULT_SLEEP_SECONDS,
++        help="Pause after each upstream fetch (fetch_market_chart's throttle).",
++    )
++    parser.add_argument("--seed", type=int, default=0)
++    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
++    args = parser.parse_args()
++    if args.mode == "apptest" and args.cache == "off":
++        parser.error(
++            "--cache off is not supported with --mode apptest: app.py applies its own "
++            "24h st.cache_data and store TTLs; use --cache cold or --cache warm"
++        )
++
++    mock = MockCoinGecko(
++        latency=args.latency,
++        jitter=args.jitter,
++        rate_limit_per_minute=args.rate_limit_per_minute,
++        rate_limit_probability=args.rate_limit_probability,
++        days=args.days,
++        points_per_day=args.points_per_day,
++    )
++    with tempfile.TemporaryDirectory() as tmp, mock:
++        os.chdir(tmp)
++        data_source.API_URL_TEMPLATE = mock.url_template
++        data_source.CACHE_DIR = Path(tmp) / "data"
++        data_source.DEFAULT_SLEEP_SECONDS = args.client_sleep
++        if args.cache == "warm":
++            data_source.sync_timeseries_store(COINS)
++            mock.reset_stats()
++
++        start = time.perf_counter()
++        with ThreadPoolExecutor(max_workers=args.users) as pool:
++            per_user = list(pool.map(lambda user: _run_user(user, args), range(args.users)))
++        wall_seconds = time.perf_counter() - start
++        os.chdir(REPO_ROOT)
++
++    samples = [sample for samples in per_user for sample in samples]
++    report = summarize(samples, wall_seconds, mock.stats.as_dict())
++    if args.json:
++        print(json.dumps(report, indent=2))
++    else:
++        _print_report(report)
++
++
++if __name__ == "__main__":
++    main()
+ 
+EOF
+)
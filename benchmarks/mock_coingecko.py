@@ -0,0 +1,265 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/benchmarks/mock_coingecko.py
+index 0000000000000000000000000000000000000000..526a3c48326a712e820c642ca2500a52c9b666e6 100644
+--- a//dev/null
++++ b/benchmarks/mock_coingecko.py
+@@ -0,0 +1,256 @@
++"""Local stand-in for the CoinGecko ``market_chart`` endpoint.
++
++The server mimics ``API_URL_TEMPLATE`` closely enough for ``fetch_market_chart``
++and can inject latency, HTTP 429 rate-limit responses and arbitrary payload
++sizes. It can be embedded (see ``benchmarks/load_driver.py``) or run on its own
++and pointed at by the app::
++
++    python benchmarks/mock_coingecko.py --port 8765 --latency 0.3 --rate-limit-per-minute 30
++    COINGECKO_API_URL_TEMPLATE=http://127.0.0.1:8765/api/v3/coins/{coin_id}/market_chart \\
++        streamlit run app.py
++"""
++from __future__ import annotations
++
++import argparse
++import json
++import random
++import threading
++import time
++import zlib
++from collections import deque
++from dataclasses import dataclass, field
++from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
++from typing import Deque, Dict, Optional, Tuple
++from urllib.parse import parse_qs, urlparse
++
++DAY_MS = 86_400_000
++PATH_PREFIX = "/api/v3/coins/"
++PATH_SUFFIX = "/market_chart"
++BASE_PRICES = {"bitcoin": 800.0, "ripple": 0.02}
++
++
++@dataclass
++class MockStats:
++    calls: int = 0
++    ok: int = 0
++    rate_limited: int = 0
++    not_found: int = 0
++    bytes_sent: int = 0
++    per_coin: Dict[str, int] = field(default_factory=dict)
++
++    def as_dict(self) -> Dict[str, object]:
++        return {
++            "calls": self.calls,
++            "ok": self.ok,
++            "rate_limited": self.rate_limited,
++            "not_found": self.not_found,
++            "bytes_sent": self.bytes_sent,
++            "per_coin": dict(self.per_coin),
++        }
++
++
++def build_payload(coin_id: str, days: int, points_per_day: int = 1) -> Dict[str, list]:
++    """Build a deterministic random-walk payload shaped like CoinGecko's response."""
++
++    rng = random.Random(zlib.crc32(coin_id.encode("utf-8")))
++    price = BASE_PRICES.get(coin_id, 10.0)
++    step_ms = DAY_MS // points_per_day
++    start_ms = int(time.time() // 86_400) * DAY_MS - days * DAY_MS
++    prices, market_caps, total_volumes = [], [], []
++    for i in range(days * points_per_day):
++        ts = start_ms + i * step_ms
++        price *= 1.0 + rng.gauss(0.0005, 0.03) / points_per_day ** 0.5
++        price = max(price, 1e-9)
++        prices.append([ts, price])
++        market_caps.append([ts, price * 19_000_000])
++        total_volumes.append([ts, price * rng.uniform(1e5, 1e6)])
++    return {"prices": prices, "market_caps": market_caps, "total_volumes": total_volumes}
++
++
++class MockCoinGecko:
++    """Threaded HTTP server serving synthetic ``market_chart`` payloads.
++
++    Parameters
++    ----------
++    latency: float
++        Seconds to wait before answering every request.
++    jitter: float
++        Extra uniformly distributed delay in ``[0, jitter]`` seconds.
++    rate_limit_per_minute: Optional[int]
++        Answer 429 once more than this many requests arrived in the last 60s.
++    rate_limit_probability: float
++        Probability of answering 429 regardless of the request rate.
++    days: int
++        History length served for ``days=max``.
++    points_per_day: int
++        Observations per day, to scale payload size.
++    """
++
++    def __init__(
++        self,
++        latency: float = 0.0,
++        jitter: float = 0.0,
++        rate_limit_per_minute: Optional[int] = None,
++        rate_limit_probability: float = 0.0,
++        days: int = 4000,
++        points_per_day: int = 1,
++        host: str = "127.0.0.1",
++        port: int = 0,
++    ) -> None:
++        self.latency = latency
++        self.jitter = jitter
++        self.rate_limit_per_minute = rate_limit_per_minute
++        self.rate_limit_probability = rate_limit_probability
++        self.days = days
++        self.points_per_day = points_per_day
++        self.stats = MockStats()
++        self._lock = threading.Lock()
++        self._recent: Deque[float] = deque()
++        self._payloads: Dict[Tuple[str, int], bytes] = {}
++        self._server = ThreadingHTTPServer((host, port), self._handler_class())
++        self._server.daemon_threads = True
++        self._thread: Optional[threading.Thread] = None
++
++    @property
++    def url_template(self) -> str:
++        host, port = self._server.server_address[:2]
++        return f"http://{host}:{port}{PATH_PREFIX}{{coin_id}}{PATH_SUFFIX}"
++
++    def start(self) -> "MockCoinGecko":
++        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
++        self._thread.start()
++        return self
++
++    def stop(self) -> None:
++        self._server.shutdown()
++        self._server.server_close()
++        if self._thread is not None:
++            self._thread.join()
++
++    def reset_stats(self) -> None:
++        with self._lock:
++            self.stats = MockStats()
++            self._recent.clear()
++
++    def serve_forever(self) -> None:
++        """Serve in the calling thread until interrupted."""
++
++        try:
++            self._server.serve_forever()
++        finally:
++            self._server.server_close()
++
++    def __enter__(self) -> "MockCoinGecko":
++        return self.start()
++
++    def __exit__(self, *exc_info: object) -> None:
++        self.stop()
++
++    def _payload(self, coin_id: str, days: int) -> bytes:
++        key = (coin_id, days)
++        with self._lock:
++            cached = self._payloads.get(key)
++        if cached is None:
++            cached = json.dumps(build_payload(coin_id, days, self.points_per_day)).encode()
++            with self._lock:
++                self._payloads[key] = cached
++        return cached
++
++    def _should_rate_limit(self) -> bool:
++        now = time.monotonic()
++        with self._lock:
++            self._recent.append(now)
++            while self._recent and now - self._recent[0] > 60.0:
++                self._recent.popleft()
++            over_limit = (
++                self.rate_limit_per_minute is not None
++                and len(self._recent) > self.rate_limit_per_minute
++            )
++        return over_limit or random.random() < self.rate_limit_probability
++
++    def _handler_class(self) -> type:
++        mock = self
++
++        class Handler(BaseHTTPRequestHandler):
++            def do_GET(self) -> None:  # noqa: N802 - http.server naming
++                parsed = urlparse(self.path)
++                path = parsed.path
++                with mock._lock:
++                    mock.stats.calls += 1
++                delay = mock.latency + random.uniform(0.0, mock.jitter)
++                if delay > 0:
++                    time.sleep(delay)
++
++                if not (path.startswith(PATH_PREFIX) and path.endswith(PATH_SUFFIX)):
++                    with mock._lock:
++                        mock.stats.not_found += 1
++                    self._send(404, b'{"error":"not found"}')
++                    return
++                coin_id = path[len(PATH_PREFIX) : -len(PATH_SUFFIX)]
++                with mock._lock:
++                    mock.stats.per_coin[coin_id] = mock.stats.per_coin.get(coin_id, 0) + 1
++
++                if mock._should_rate_limit():
++                    with mock._lock:
++                        mock.stats.rate_limited += 1
++                    self._send(429, b'{"status":{"error_code":429}}', {"Retry-After": "60"})
++                    return
++
++                days_param = parse_qs(parsed.query).get("days", ["max"])[0]
++                days = mock.days if days_param == "max" else min(int(days_param), mock.days)
++                body = mock._payload(coin_id, days)
++                with mock._lock:
++                    mock.stats.ok += 1
++                    mock.stats.bytes_sent += len(body)
++                self._send(200, body)
++
++            def _send(
++                self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None
++            ) -> None:
++                self.send_response(status)
++                self.send_header("Content-Type", "application/json")
++                self.send_header("Content-Length", str(len(body)))
++                for name, value in (headers or {}).items():
++                    self.send_header(name, value)
++                self.end_headers()
++                self.wfile.write(body)
++
++            def log_message(self, format: str, *args: object) -> None:
++                pass
++
++        return Handler
++
++
++def main() -> None:
++    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
++    parser.add_argument("--host", default="127.0.0.1")
++    parser.add_argument("--port", type=int, default=8765)
++    parser.add_argument("--latency", type=float, default=0.0)
++    parser.add_argument("--jitter", type=float, default=0.0)
++    parser.add_argument("--rate-limit-per-minute", type=int, default=None)
++    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
++    parser.add_argument("--days", type=int, default=4000)
++    parser.add_argument("--points-per-day", type=int, default=1)
++    args = parser.parse_args()
++
++    mock = MockCoinGecko(
++        latency=args.latency,
++        jitter=args.jitter,
++        rate_limit_per_minute=args.rate_limit_per_minute,
++        rate_limit_probability=args.rate_limit_probability,
++        days=args.days,
++        points_per_day=args.points_per_day,
++        host=args.host,
++        port=args.port,
++    )
++    print(f"Serving {mock.url_template}")
++    try:
++        mock.serve_forever()
++    except KeyboardInterrupt:
++        pass
++    finally:
++        print(json.dumps(mock.stats.as_dict()))
++
++
++if __name__ == "__main__":
++    main()
+ 
+EOF
+)
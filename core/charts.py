@@ -1,25 +1,43 @@
  (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
 diff --git a//dev/null b/core/charts.py
-index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896bf384fc37 100644
+index 0000000000000000000000000000000000000000..89e7ec29ccf6fb52f0909ce278c3bb0010bef2f3 100644
 --- a//dev/null
 +++ b/core/charts.py
-@@ -0,0 +1,100 @@
+@@ -0,0 +1,122 @@
 +"""Charting helpers for XRP vs BTC analysis."""
 +from __future__ import annotations
 +
 +from pathlib import Path
-+from typing import Optional
++from types import ModuleType
++from typing import TYPE_CHECKING, Optional
 +
-+import matplotlib.pyplot as plt
 +import pandas as pd
 +
++if TYPE_CHECKING:
++    import matplotlib.pyplot as plt
++
 +EXPORT_DIR = Path("exports")
-+EXPORT_DIR.mkdir(parents=True, exist_ok=True)
++
++
++def _pyplot() -> ModuleType:
++    """Import ``matplotlib.pyplot`` on first use to keep module import cheap."""
++
++    import matplotlib.pyplot as plt
++
++    return plt
++
++
++def _export_path(filename: str) -> Path:
++    """Return the export path for ``filename``, creating ``EXPORT_DIR`` on demand."""
++
++    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
++    return EXPORT_DIR / filename
 +
 +
 +def _configure_style() -> None:
 +    """Configure matplotlib style with graceful fallback."""
 +
++    plt = _pyplot()
 +    try:
 +        plt.style.use("seaborn-v0_8")
 +    except OSError:
@@ -30,6 +48,7 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +
 +def plot_indexed_growth(df: pd.DataFrame, save: bool = False) -> plt.Figure:
 +    _configure_style()
++    plt = _pyplot()
 +    fig, ax = plt.subplots(figsize=(10, 6))
 +    ax.plot(df["date"], df["btc_indexed"], label="BTC Indexed", color="tab:blue")
 +    ax.plot(df["date"], df["xrp_indexed"], label="XRP Indexed", color="tab:orange")
@@ -40,13 +59,14 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +    ax.grid(True, alpha=0.3)
 +    fig.tight_layout()
 +    if save:
-+        fig_path = EXPORT_DIR / "01_indexed_growth.png"
++        fig_path = _export_path("01_indexed_growth.png")
 +        fig.savefig(fig_path, dpi=150)
 +    return fig
 +
 +
 +def plot_ratio(df: pd.DataFrame, save: bool = False) -> plt.Figure:
 +    _configure_style()
++    plt = _pyplot()
 +    fig, ax = plt.subplots(figsize=(10, 4))
 +    ax.plot(df["date"], df["xrp_btc_ratio"], label="XRP/BTC Ratio", color="tab:green")
 +    ax.set_title("XRP/BTC Ratio")
@@ -56,13 +76,14 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +    ax.grid(True, alpha=0.3)
 +    fig.tight_layout()
 +    if save:
-+        fig_path = EXPORT_DIR / "02_ratio_xrp_btc.png"
++        fig_path = _export_path("02_ratio_xrp_btc.png")
 +        fig.savefig(fig_path, dpi=150)
 +    return fig
 +
 +
 +def plot_zscores(df: pd.DataFrame, save: bool = False) -> plt.Figure:
 +    _configure_style()
++    plt = _pyplot()
 +    fig, ax = plt.subplots(figsize=(10, 4))
 +    ax.plot(df["date"], df["btc_z"], label="BTC Z-Score", color="tab:purple")
 +    ax.plot(df["date"], df["xrp_z"], label="XRP Z-Score", color="tab:red")
@@ -74,7 +95,7 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +    ax.grid(True, alpha=0.3)
 +    fig.tight_layout()
 +    if save:
-+        fig_path = EXPORT_DIR / "03_zscores.png"
++        fig_path = _export_path("03_zscores.png")
 +        fig.savefig(fig_path, dpi=150)
 +    return fig
 +
@@ -83,6 +104,7 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +    if "btc_drawdown" not in df.columns or "xrp_drawdown" not in df.columns:
 +        return None
 +    _configure_style()
++    plt = _pyplot()
 +    fig, ax = plt.subplots(figsize=(10, 4))
 +    ax.plot(df["date"], df["btc_drawdown"], label="BTC Drawdown", color="tab:blue")
 +    ax.plot(df["date"], df["xrp_drawdown"], label="XRP Drawdown", color="tab:orange")
@@ -93,7 +115,7 @@ index 0000000000000000000000000000000000000000..94b881fb4358f02b9ba910b6a389896b
 +    ax.grid(True, alpha=0.3)
 +    fig.tight_layout()
 +    if save:
-+        fig_path = EXPORT_DIR / "04_drawdowns.png"
++        fig_path = _export_path("04_drawdowns.png")
 +        fig.savefig(fig_path, dpi=150)
 +    return fig
 +
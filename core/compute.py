@@ -1,18 +1,19 @@
  (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
 diff --git a//dev/null b/core/compute.py
-index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2dfe87ff01 100644
+index 0000000000000000000000000000000000000000..788c2fda6e15cf7ccf624136f92497501e09ba88 100644
 --- a//dev/null
 +++ b/core/compute.py
-@@ -0,0 +1,209 @@
+@@ -0,0 +1,354 @@
 +"""Computation utilities for XRP vs BTC analysis."""
 +from __future__ import annotations
 +
 +from dataclasses import dataclass
 +from datetime import datetime
-+from typing import Dict, Optional, Tuple
++from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
 +
 +import numpy as np
 +import pandas as pd
++from pandas.tseries.frequencies import to_offset
 +
 +
 +@dataclass
@@ -45,6 +46,25 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +        }
 +
 +
++_OPTIONAL_COLUMNS = {
++    "open": "open",
++    "high": "high",
++    "low": "low",
++    "total_volume": "volume",
++    "market_cap": "market_cap",
++}
++
++_AGGREGATIONS = {
++    "open": "first",
++    "high": "max",
++    "low": "min",
++    "usd": "last",
++    "volume": "sum",
++    "units": "sum",
++    "market_cap": "last",
++}
++
++
 +def calculate_cagr(start_price: float, end_price: float, years: float) -> float:
 +    if start_price <= 0 or end_price <= 0 or years <= 0:
 +        return float("nan")
@@ -104,6 +124,45 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +    return df
 +
 +
++def _prepare_asset(df: pd.DataFrame, asset: str) -> pd.DataFrame:
++    """Prefix an asset frame's columns and derive the fields used for resampling.
++
++    Frames carrying only ``date``/``price`` are accepted; open/high/low then fall
++    back to the price, and volume/market-cap columns are simply omitted.
++    """
++
++    df = _ensure_datetime(df)
++    for column in ("open", "high", "low"):
++        if column not in df.columns:
++            df[column] = df["price"]
++    renames = {"price": f"{asset}_usd"}
++    for source, target in _OPTIONAL_COLUMNS.items():
++        if source in df.columns:
++            renames[source] = f"{asset}_{target}"
++    df = df.rename(columns=renames)[["date", *renames.values()]]
++    if f"{asset}_volume" in df.columns:
++        df[f"{asset}_units"] = df[f"{asset}_volume"] / df[f"{asset}_usd"]
++    return df
++
++
++def _aggregation_spec(columns: pd.Index) -> Dict[str, str]:
++    """Map each merged column to its per-period aggregation."""
++
++    spec: Dict[str, str] = {}
++    for asset in ("btc", "xrp"):
++        for suffix, how in _AGGREGATIONS.items():
++            column = f"{asset}_{suffix}"
++            if column in columns:
++                spec[column] = how
++    return spec
++
++
++def _volume_weighted(volume: pd.Series, units: pd.Series) -> pd.Series:
++    """USD volume over coin units traded, i.e. the volume-weighted average price."""
++
++    return volume / units.where(units > 0)
++
++
 +def compute(
 +    df_btc: pd.DataFrame,
 +    df_xrp: pd.DataFrame,
@@ -113,10 +172,18 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +    rolling_days: Optional[int] = None,
 +    include_drawdown: bool = False,
 +) -> Tuple[pd.DataFrame, Dict[str, float]]:
-+    """Compute aligned metrics for BTC and XRP."""
++    """Compute aligned metrics for BTC and XRP.
 +
-+    btc = _ensure_datetime(df_btc).rename(columns={"price": "btc_usd"})
-+    xrp = _ensure_datetime(df_xrp).rename(columns={"price": "xrp_usd"})
++    Each period carries open/high/low/close (``*_usd``) prices. When the inputs
++    include ``total_volume`` and ``market_cap`` the output also has summed
++    ``*_volume``, last ``*_market_cap`` and volume-weighted prices (``*_vwap``
++    per period, ``*_vwap_cum`` anchored at the first period). Like CoinGecko's
++    ``total_volumes``, ``*_volume`` is in USD; the VWAPs weight each day by the
++    coin units traded, ``volume / price``.
++    """
++
++    btc = _prepare_asset(df_btc, "btc")
++    xrp = _prepare_asset(df_xrp, "xrp")
 +
 +    merged = pd.merge(btc, xrp, on="date", how="inner")
 +    merged = merged.sort_values("date").reset_index(drop=True)
@@ -128,7 +195,8 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +
 +    merged = merged.set_index("date")
 +
-+    resampled = merged.resample(frequency).last().dropna()
++    resampled = merged.resample(frequency).agg(_aggregation_spec(merged.columns))
++    resampled = resampled.dropna(subset=["btc_usd", "xrp_usd"])
 +    resampled = resampled[resampled["btc_usd"] > 0]
 +    resampled = resampled[resampled["xrp_usd"] > 0]
 +
@@ -162,6 +230,14 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +
 +    resampled["is_month_end"] = resampled.index.is_month_end
 +
++    for asset in ("btc", "xrp"):
++        if f"{asset}_units" not in resampled.columns:
++            continue
++        volume = resampled[f"{asset}_volume"]
++        units = resampled[f"{asset}_units"]
++        resampled[f"{asset}_vwap"] = _volume_weighted(volume, units)
++        resampled[f"{asset}_vwap_cum"] = _volume_weighted(volume.cumsum(), units.cumsum())
++
 +    if rolling_days:
 +        periods = _rolling_periods(rolling_days, period_days)
 +        period_years = _calculate_period_years(periods, period_days)
@@ -174,6 +250,13 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +        resampled[f"ratio_rolling_{rolling_days}"] = (
 +            resampled["xrp_btc_ratio"].rolling(window=periods).mean()
 +        )
++        for asset in ("btc", "xrp"):
++            if f"{asset}_units" not in resampled.columns:
++                continue
++            resampled[f"{asset}_vwap_rolling_{rolling_days}"] = _volume_weighted(
++                resampled[f"{asset}_volume"].rolling(window=periods).sum(),
++                resampled[f"{asset}_units"].rolling(window=periods).sum(),
++            )
 +
 +    if include_drawdown:
 +        resampled["btc_drawdown"] = compute_drawdown(resampled["btc_usd"])
@@ -201,14 +284,76 @@ index 0000000000000000000000000000000000000000..286a6f24073201e3f4f893d585c8dc2d
 +        ratio_end=float(resampled["xrp_btc_ratio"].iloc[-1]),
 +    )
 +
++    resampled = resampled.drop(
++        columns=[column for column in resampled.columns if column.endswith("_units")]
++    )
 +    result = resampled.reset_index().rename(columns={"date": "date"})
 +    result["date"] = result["date"].dt.date
 +
 +    return result, summary.to_dict()
 +
 +
++RangeLoader = Callable[
++    [Sequence[str], Optional[pd.Timestamp], Optional[pd.Timestamp]],
++    Mapping[str, pd.DataFrame],
++]
++
++
++def _period_start(timestamp: pd.Timestamp, frequency: str) -> Optional[pd.Timestamp]:
++    """Return the first day of the resample bin containing ``timestamp``.
++
++    The bin is taken from ``resample`` itself, so right-closed frequencies
++    (``"ME"``, ``"W"``, ``"QE"``) and left-closed ones (``"D"``, ``"MS"``) line
++    up with :func:`compute`. Bins of a multiple such as ``"2W"`` are anchored on
++    the first observation, so no window reproduces them and ``None`` (load
++    everything) is returned instead.
++    """
++
++    offset = to_offset(frequency)
++    if offset.n != 1:
++        return None
++    ts = pd.to_datetime(timestamp, utc=True).normalize()
++    days = pd.date_range(ts - 2 * offset, ts + offset, freq="D")
++    firsts = pd.Series(days, index=days).resample(frequency).transform("min")
++    return firsts[ts]
++
++
++def compute_window(
++    load_range: RangeLoader,
++    coins: Tuple[str, str] = ("bitcoin", "ripple"),
++    frequency: str = "M",
++    rebase_date: Optional[pd.Timestamp] = None,
++    end_date: Optional[pd.Timestamp] = None,
++    z_log: bool = False,
++    rolling_days: Optional[int] = None,
++    include_drawdown: bool = False,
++) -> Tuple[pd.DataFrame, Dict[str, float]]:
++    """Load only the needed window for ``coins`` and run :func:`compute` on it.
++
++    ``load_range(coins, start, end)`` must return a frame per coin limited to
++    ``[start, end]``, e.g. :func:`core.data_source.load_market_data`. The
++    window starts at the first day of the resample bin containing
++    ``rebase_date``, so the first period's OHLC and volume match a full-history
++    computation. Multiples such as ``"2W"`` load the full history.
++    """
++
++    start = _period_start(rebase_date, frequency) if rebase_date is not None else None
++    end = pd.to_datetime(end_date, utc=True) if end_date is not None else None
++    frames = load_range(list(coins), start, end)
++    return compute(
++        frames[coins[0]],
++        frames[coins[1]],
++        frequency=frequency,
++        rebase_date=rebase_date,
++        z_log=z_log,
++        rolling_days=rolling_days,
++        include_drawdown=include_drawdown,
++    )
++
++
 +__all__ = [
 +    "compute",
++    "compute_window",
 +    "calculate_cagr",
 +    "compute_drawdown",
 +    "compute_z_scores",
@@ -1,28 +1,38 @@
  (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
 diff --git a//dev/null b/core/data_source.py
-index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e058687e99fab 100644
+index 0000000000000000000000000000000000000000..f6500adcfb874bbe2c30c28d179038eaa928e60a 100644
 --- a//dev/null
 +++ b/core/data_source.py
-@@ -0,0 +1,120 @@
+@@ -0,0 +1,229 @@
 +"""Data fetching utilities for CoinGecko market data."""
 +from __future__ import annotations
 +
 +import json
++import os
 +import time
-+from dataclasses import dataclass
++from dataclasses import dataclass, field
 +from datetime import datetime, timedelta, timezone
 +from pathlib import Path
-+from typing import Any, Dict, Optional
++from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 +
 +import pandas as pd
-+import requests
++
++from core.timeseries_store import DAILY_COLUMNS, TimeSeriesStore
++
++if TYPE_CHECKING:
++    import requests
 +
 +
 +CACHE_DIR = Path("data")
-+CACHE_DIR.mkdir(parents=True, exist_ok=True)
 +
-+API_URL_TEMPLATE = "https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
++API_URL_TEMPLATE = os.environ.get(
++    "COINGECKO_API_URL_TEMPLATE",
++    "https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart",
++)
 +DEFAULT_SLEEP_SECONDS = 1.1
++STORE_FILENAME = "timeseries.sqlite"
++
++_stores: Dict[Path, TimeSeriesStore] = {}
 +
 +
 +@dataclass
@@ -30,6 +40,8 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +    """Container for CoinGecko market chart data."""
 +
 +    prices: list[tuple[int, float]]
++    market_caps: list[tuple[int, float]] = field(default_factory=list)
++    total_volumes: list[tuple[int, float]] = field(default_factory=list)
 +
 +    @classmethod
 +    def from_json(cls, payload: Dict[str, Any]) -> "MarketChartResponse":
@@ -37,7 +49,47 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +            raise ValueError("Unexpected payload structure: missing 'prices'")
 +        prices: list[list[float]] = payload["prices"]
 +        normalized = [(int(ts), float(price)) for ts, price in prices]
-+        return cls(prices=normalized)
++        return cls(
++            prices=normalized,
++            market_caps=_normalize_pairs(payload.get("market_caps", [])),
++            total_volumes=_normalize_pairs(payload.get("total_volumes", [])),
++        )
++
++
++def _normalize_pairs(pairs: list[list[Optional[float]]]) -> list[tuple[int, float]]:
++    """Normalize ``[timestamp, value]`` pairs, mapping null values to NaN."""
++
++    return [
++        (int(ts), float(value) if value is not None else float("nan"))
++        for ts, value in pairs
++    ]
++
++
++def _daily_last(pairs: list[tuple[int, float]], column: str) -> pd.DataFrame:
++    df = pd.DataFrame(pairs, columns=["timestamp", column]).astype({column: "float64"})
++    df["date"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.normalize()
++    return df.groupby("date")[[column]].last()
++
++
++def _to_daily_frame(chart: MarketChartResponse) -> pd.DataFrame:
++    """Collapse raw market chart observations into one row per UTC day.
++
++    Prices become daily open/high/low/close (``price`` is the close). CoinGecko
++    reports market cap and volume as point-in-time readings, with volume being
++    the trailing 24h total, so the last reading of each day is kept for both.
++    """
++
++    df = pd.DataFrame(chart.prices, columns=["timestamp", "price"])
++    df["date"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.normalize()
++    daily_df = df.groupby("date").agg(
++        open=("price", "first"),
++        high=("price", "max"),
++        low=("price", "min"),
++        price=("price", "last"),
++    )
++    daily_df = daily_df.join(_daily_last(chart.market_caps, "market_cap"), how="left")
++    daily_df = daily_df.join(_daily_last(chart.total_volumes, "total_volume"), how="left")
++    return daily_df.sort_index().reset_index()[DAILY_COLUMNS]
 +
 +
 +def _cache_file_for_coin(coin_id: str) -> Path:
@@ -60,6 +112,7 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +
 +
 +def _write_to_cache(path: Path, payload: Dict[str, Any]) -> None:
++    path.parent.mkdir(parents=True, exist_ok=True)
 +    with path.open("w", encoding="utf-8") as f:
 +        json.dump(payload, f)
 +
@@ -89,8 +142,10 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +    Returns
 +    -------
 +    pd.DataFrame
-+        DataFrame with columns ``date`` (datetime normalized to UTC midnight)
-+        and ``price`` (float), representing the last observed price per day.
++        One row per day with columns ``date`` (datetime normalized to UTC
++        midnight), ``open``, ``high``, ``low`` and ``price`` (the last observed
++        price of the day), plus ``market_cap`` and ``total_volume`` (last
++        reading of the day, NaN when the payload omits them).
 +    """
 +
 +    cache_path = _cache_file_for_coin(coin_id)
@@ -99,6 +154,8 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +        payload = _load_from_cache(cache_path)
 +
 +    if payload is None:
++        import requests
++
 +        params = {"vs_currency": vs_currency, "days": days}
 +        url = API_URL_TEMPLATE.format(coin_id=coin_id)
 +        http = session or requests.Session()
@@ -115,15 +172,67 @@ index 0000000000000000000000000000000000000000..1fea99a9027a767f63f3140bb73e0586
 +    if not chart.prices:
 +        raise ValueError(f"No price data returned for {coin_id}")
 +
-+    df = pd.DataFrame(chart.prices, columns=["timestamp", "price"])
-+    df["date"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.normalize()
-+    daily_df = (
-+        df.groupby("date", as_index=False)["price"].last().sort_values("date").reset_index(drop=True)
-+    )
-+    return daily_df[["date", "price"]]
++    return _to_daily_frame(chart)
++
++
++def get_timeseries_store() -> TimeSeriesStore:
++    """Return the time-series store under ``CACHE_DIR``, opening it on first use."""
++
++    path = (CACHE_DIR / STORE_FILENAME).resolve()
++    store = _stores.get(path)
++    if store is None:
++        store = _stores.setdefault(path, TimeSeriesStore(path))
++    return store
++
++
++def sync_timeseries_store(
++    coin_ids: Sequence[str],
++    cache_ttl_hours: int = 24,
++    session: Optional[requests.Session] = None,
++) -> TimeSeriesStore:
++    """Refresh coins not ingested within ``cache_ttl_hours`` and return the store.
++
++    Stale coins are fetched with :func:`fetch_market_chart` and written to the
++    store together in a single bulk ingest.
++    """
++
++    store = get_timeseries_store()
++    cutoff = time.time() - cache_ttl_hours * 3600
++    stale = [coin for coin in coin_ids if (store.updated_at(coin) or 0.0) <= cutoff]
++    if stale:
++        store.ingest(
++            {
++                coin: fetch_market_chart(coin, cache_ttl_hours=cache_ttl_hours, session=session)
++                for coin in stale
++            }
++        )
++    return store
++
++
++def load_market_data(
++    coin_ids: Sequence[str],
++    start: Optional[pd.Timestamp] = None,
++    end: Optional[pd.Timestamp] = None,
++    cache_ttl_hours: int = 24,
++    session: Optional[requests.Session] = None,
++) -> Dict[str, pd.DataFrame]:
++    """Load daily data for ``coin_ids`` restricted to ``[start, end]``.
++
++    Only the requested coins and dates are read from the local store, so the
++    cost follows the window size rather than the full history. Frames have the
++    same columns as :func:`fetch_market_chart`.
++    """
++
++    store = sync_timeseries_store(coin_ids, cache_ttl_hours=cache_ttl_hours, session=session)
++    return store.query_many(coin_ids, start, end)
 +
 +
-+__all__ = ["fetch_market_chart"]
++__all__ = [
++    "fetch_market_chart",
++    "get_timeseries_store",
++    "load_market_data",
++    "sync_timeseries_store",
++]
  
 EOF
 )
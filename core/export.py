@@ -0,0 +1,130 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/core/export.py
+index 0000000000000000000000000000000000000000..96093e24399ddba830d1b89475ef3000417d7c5c 100644
+--- a//dev/null
++++ b/core/export.py
+@@ -0,0 +1,121 @@
++"""Export helpers that stream result sets to disk instead of holding copies in memory."""
++from __future__ import annotations
++
++import io
++import os
++import tempfile
++import zipfile
++from pathlib import Path
++from typing import IO, Mapping, Optional, Union
++
++import numpy as np
++import pandas as pd
++
++CSV_CHUNK_ROWS = 10_000
++COLUMNAR_FORMATS = ("parquet", "arrow", "npz")
++
++
++def write_csv(
++    df: pd.DataFrame,
++    destination: Union[Path, IO[str]],
++    chunk_rows: int = CSV_CHUNK_ROWS,
++) -> None:
++    """Write ``df`` as CSV in chunks of ``chunk_rows`` rows.
++
++    ``destination`` may be a path or an open text stream (for example a ZIP
++    entry wrapped in :class:`io.TextIOWrapper`), so writing never materializes
++    the full CSV text in memory.
++    """
++
++    df.to_csv(destination, index=False, chunksize=chunk_rows)
++
++
++def write_zip(
++    path: Path,
++    files: Mapping[str, Path],
++    frames: Optional[Mapping[str, pd.DataFrame]] = None,
++    chunk_rows: int = CSV_CHUNK_ROWS,
++) -> Path:
++    """Write a ZIP archive to ``path`` through a temporary file on the same disk.
++
++    ``files`` maps archive names to files that are copied in from disk, and
++    ``frames`` maps archive names to DataFrames that are streamed as CSV
++    directly into their entries. The archive replaces ``path`` only once it is
++    complete.
++    """
++
++    path.parent.mkdir(parents=True, exist_ok=True)
++    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".zip.tmp")
++    os.close(fd)
++    try:
++        with zipfile.ZipFile(tmp_name, "w", compression=zipfile.ZIP_DEFLATED) as archive:
++            for arcname, source in files.items():
++                archive.write(source, arcname=arcname)
++            for arcname, df in (frames or {}).items():
++                with archive.open(arcname, "w") as raw, io.TextIOWrapper(
++                    raw, encoding="utf-8", newline=""
++                ) as text:
++                    write_csv(df, text, chunk_rows=chunk_rows)
++        os.replace(tmp_name, path)
++    except BaseException:
++        Path(tmp_name).unlink(missing_ok=True)
++        raise
++    return path
++
++
++def _numpy_column(series: pd.Series) -> np.ndarray:
++    if series.dtype == object:
++        try:
++            return pd.to_datetime(series).to_numpy(dtype="datetime64[ns]")
++        except (TypeError, ValueError):
++            return series.astype(str).to_numpy()
++    if isinstance(series.dtype, pd.DatetimeTZDtype):
++        return series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
++    return series.to_numpy()
++
++
++def _write_npz(df: pd.DataFrame, path: Path) -> None:
++    arrays = {str(column): _numpy_column(df[column]) for column in df.columns}
++    with path.open("wb") as f:
++        np.savez_compressed(f, **arrays)
++
++
++def write_columnar(df: pd.DataFrame, path_stem: Path, fmt: Optional[str] = None) -> Path:
++    """Write ``df`` in a compact columnar format and return the written path.
++
++    ``fmt`` is one of ``"parquet"``, ``"arrow"`` (Arrow IPC) or ``"npz"``. When
++    omitted, Parquet is used if ``pyarrow`` is installed, otherwise a compressed
++    NumPy ``.npz`` archive with one array per column.
++    """
++
++    if fmt is None:
++        try:
++            import pyarrow  # noqa: F401
++        except ImportError:
++            fmt = "npz"
++        else:
++            fmt = "parquet"
++    if fmt not in COLUMNAR_FORMATS:
++        raise ValueError(f"Unsupported columnar format: {fmt}")
++
++    path = path_stem.with_suffix(f".{fmt}")
++    path.parent.mkdir(parents=True, exist_ok=True)
++    if fmt == "npz":
++        _write_npz(df, path)
++        return path
++
++    import pyarrow as pa
++
++    table = pa.Table.from_pandas(df, preserve_index=False)
++    if fmt == "parquet":
++        import pyarrow.parquet as pq
++
++        pq.write_table(table, path)
++    else:
++        import pyarrow.feather as feather
++
++        feather.write_feather(table, path)
++    return path
++
++
++__all__ = ["write_csv", "write_zip", "write_columnar"]
+ 
+EOF
+)
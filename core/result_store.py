@@ -0,0 +1,164 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/core/result_store.py
+index 0000000000000000000000000000000000000000..3063dea51196cca521c81e3a215b38a876fef07b 100644
+--- a//dev/null
++++ b/core/result_store.py
+@@ -0,0 +1,155 @@
++"""Process-wide store of computed result frames shared read-only across sessions."""
++from __future__ import annotations
++
++import threading
++import time
++from collections import OrderedDict
++from dataclasses import dataclass, field
++from types import MappingProxyType
++from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple
++
++import numpy as np
++import pandas as pd
++
++DEFAULT_MAX_ENTRIES = 32
++
++
++@dataclass
++class _Entry:
++    columns: Dict[str, np.ndarray]
++    summary: Mapping[str, object]
++    nbytes: int
++    created: float = field(default_factory=time.time)
++    hits: int = 0
++
++
++def _freeze(df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], int]:
++    """Copy each column into a read-only array and return them with their size."""
++
++    nbytes = int(df.memory_usage(index=False, deep=True).sum())
++    columns: Dict[str, np.ndarray] = {}
++    for column in df.columns:
++        values = df[column].to_numpy(copy=True)
++        values.flags.writeable = False
++        columns[str(column)] = values
++    return columns, nbytes
++
++
++class ResultStore:
++    """Keep one read-only copy of each computed result for the whole process.
++
++    Sessions hold only the key returned by :meth:`put`. :meth:`frame` builds a
++    DataFrame over the stored arrays without copying them, so per-session
++    memory no longer grows with the size of the results. In-place writes to
++    stored values raise ``ValueError``; new columns only land on the caller's
++    own frame. The least recently used entry is dropped past ``max_entries``.
++    """
++
++    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
++        self.max_entries = max_entries
++        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
++        self._lock = threading.Lock()
++        self._pending: Dict[Hashable, threading.Event] = {}
++
++    def __contains__(self, key: Hashable) -> bool:
++        with self._lock:
++            return key in self._entries
++
++    def __len__(self) -> int:
++        with self._lock:
++            return len(self._entries)
++
++    def put(
++        self, key: Hashable, df: pd.DataFrame, summary: Mapping[str, object]
++    ) -> Hashable:
++        columns, nbytes = _freeze(df)
++        entry = _Entry(columns=columns, summary=MappingProxyType(dict(summary)), nbytes=nbytes)
++        with self._lock:
++            self._entries[key] = entry
++            self._entries.move_to_end(key)
++            while len(self._entries) > self.max_entries:
++                self._entries.popitem(last=False)
++        return key
++
++    def get_or_compute(
++        self,
++        key: Hashable,
++        compute_fn: Callable[[], Tuple[pd.DataFrame, Mapping[str, object]]],
++    ) -> Hashable:
++        """Store the result of ``compute_fn`` under ``key`` unless it is already present.
++
++        Only the first caller for a missing key runs ``compute_fn``; concurrent
++        callers for the same key wait for it instead of computing again. If
++        that computation fails, the next waiter retries it.
++        """
++
++        while True:
++            with self._lock:
++                if key in self._entries:
++                    return key
++                pending = self._pending.get(key)
++                if pending is None:
++                    pending = self._pending[key] = threading.Event()
++                    break
++            pending.wait()
++
++        try:
++            df, summary = compute_fn()
++            self.put(key, df, summary)
++        finally:
++            with self._lock:
++                del self._pending[key]
++            pending.set()
++        return key
++
++    def _touch(self, key: Hashable) -> Optional[_Entry]:
++        with self._lock:
++            entry = self._entries.get(key)
++            if entry is not None:
++                entry.hits += 1
++                self._entries.move_to_end(key)
++            return entry
++
++    def frame(self, key: Hashable) -> Optional[pd.DataFrame]:
++        """Return a zero-copy, read-only view of the stored frame, or ``None``."""
++
++        entry = self._touch(key)
++        if entry is None:
++            return None
++        return pd.DataFrame(entry.columns, copy=False)
++
++    def summary(self, key: Hashable) -> Optional[Mapping[str, object]]:
++        with self._lock:
++            entry = self._entries.get(key)
++        return None if entry is None else entry.summary
++
++    def memory_usage(self) -> pd.DataFrame:
++        """Return one row per entry with its size, shape, hit count and age."""
++
++        now = time.time()
++        with self._lock:
++            rows = [
++                {
++                    "key": repr(key),
++                    "rows": len(next(iter(entry.columns.values()), ())),
++                    "columns": len(entry.columns),
++                    "bytes": entry.nbytes,
++                    "hits": entry.hits,
++                    "age_seconds": round(now - entry.created, 1),
++                }
++                for key, entry in self._entries.items()
++            ]
++        return pd.DataFrame(
++            rows, columns=["key", "rows", "columns", "bytes", "hits", "age_seconds"]
++        )
++
++    def total_bytes(self) -> int:
++        with self._lock:
++            return sum(entry.nbytes for entry in self._entries.values())
++
++    def clear(self) -> None:
++        with self._lock:
++            self._entries.clear()
++
++
++__all__ = ["ResultStore"]
+ 
+EOF
+)
@@ -0,0 +1,152 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/core/timeseries_store.py
+index 0000000000000000000000000000000000000000..9bbf614806b57962191becc0e0e0bd0a5bc7efdb 100644
+--- a//dev/null
++++ b/core/timeseries_store.py
+@@ -0,0 +1,143 @@
++"""SQLite-backed store of daily market data keyed by (coin, day)."""
++from __future__ import annotations
++
++import sqlite3
++import time
++from contextlib import closing
++from pathlib import Path
++from typing import Dict, Iterable, Mapping, Optional, Tuple
++
++import pandas as pd
++
++VALUE_COLUMNS = ["open", "high", "low", "price", "market_cap", "total_volume"]
++DAILY_COLUMNS = ["date", *VALUE_COLUMNS]
++
++_SCHEMA = """
++CREATE TABLE IF NOT EXISTS daily (
++    coin TEXT NOT NULL,
++    ts INTEGER NOT NULL,
++    open REAL,
++    high REAL,
++    low REAL,
++    price REAL NOT NULL,
++    market_cap REAL,
++    total_volume REAL,
++    PRIMARY KEY (coin, ts)
++) WITHOUT ROWID;
++CREATE TABLE IF NOT EXISTS coins (
++    coin TEXT PRIMARY KEY,
++    updated_at REAL NOT NULL
++);
++"""
++
++
++def _to_epoch_ms(value: pd.Timestamp) -> int:
++    ts = pd.Timestamp(value)
++    if ts.tzinfo is None:
++        ts = ts.tz_localize("UTC")
++    return int(ts.value // 1_000_000)
++
++
++class TimeSeriesStore:
++    """Daily OHLC, market-cap and volume rows with range queries by coin and date.
++
++    Rows are keyed by ``(coin, ts)`` where ``ts`` is the UTC day in epoch
++    milliseconds, so a query for ``[start, end]`` reads only that slice of the
++    primary-key index. Each operation opens its own connection, so one store
++    can be shared across threads. ``path`` is resolved up front, so a later
++    change of working directory does not switch databases.
++    """
++
++    def __init__(self, path: Path) -> None:
++        self.path = Path(path).resolve()
++        self.path.parent.mkdir(parents=True, exist_ok=True)
++        with closing(self._connect()) as conn:
++            conn.execute("PRAGMA journal_mode=WAL")
++            conn.executescript(_SCHEMA)
++
++    def _connect(self) -> sqlite3.Connection:
++        return sqlite3.connect(self.path, timeout=30)
++
++    def ingest(self, frames: Mapping[str, pd.DataFrame]) -> int:
++        """Upsert daily frames for several coins in a single transaction.
++
++        Frames use the ``fetch_market_chart`` layout; missing value columns are
++        stored as NULL. Returns the number of rows written.
++        """
++
++        now = time.time()
++        rows = []
++        for coin, df in frames.items():
++            ts = pd.to_datetime(df["date"], utc=True).astype("int64") // 1_000_000
++            values = df.reindex(columns=VALUE_COLUMNS).astype("float64")
++            values = values.astype(object).where(values.notna(), None)
++            rows.extend(
++                (coin, int(day), *record)
++                for day, record in zip(ts, values.itertuples(index=False, name=None))
++            )
++        with closing(self._connect()) as conn, conn:
++            conn.executemany(
++                "INSERT OR REPLACE INTO daily (coin, ts, open, high, low, price, "
++                "market_cap, total_volume) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
++                rows,
++            )
++            conn.executemany(
++                "INSERT OR REPLACE INTO coins (coin, updated_at) VALUES (?, ?)",
++                [(coin, now) for coin in frames],
++            )
++        return len(rows)
++
++    def query(
++        self,
++        coin: str,
++        start: Optional[pd.Timestamp] = None,
++        end: Optional[pd.Timestamp] = None,
++    ) -> pd.DataFrame:
++        """Return rows for ``coin`` with ``start <= date <= end`` (bounds optional)."""
++
++        sql = f"SELECT ts, {', '.join(VALUE_COLUMNS)} FROM daily WHERE coin = ?"
++        params: list = [coin]
++        if start is not None:
++            sql += " AND ts >= ?"
++            params.append(_to_epoch_ms(start))
++        if end is not None:
++            sql += " AND ts <= ?"
++            params.append(_to_epoch_ms(end))
++        sql += " ORDER BY ts"
++        with closing(self._connect()) as conn:
++            records = conn.execute(sql, params).fetchall()
++        df = pd.DataFrame.from_records(records, columns=["ts", *VALUE_COLUMNS])
++        df = df.astype({column: "float64" for column in VALUE_COLUMNS})
++        df.insert(0, "date", pd.to_datetime(df.pop("ts").astype("int64"), unit="ms", utc=True))
++        return df[DAILY_COLUMNS]
++
++    def query_many(
++        self,
++        coins: Iterable[str],
++        start: Optional[pd.Timestamp] = None,
++        end: Optional[pd.Timestamp] = None,
++    ) -> Dict[str, pd.DataFrame]:
++        return {coin: self.query(coin, start, end) for coin in coins}
++
++    def coverage(self, coin: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp, int]]:
++        """Return ``(first_date, last_date, rows)`` for ``coin``, or ``None`` if absent."""
++
++        with closing(self._connect()) as conn:
++            first, last, count = conn.execute(
++                "SELECT MIN(ts), MAX(ts), COUNT(*) FROM daily WHERE coin = ?", (coin,)
++            ).fetchone()
++        if not count:
++            return None
++        return (
++            pd.Timestamp(first, unit="ms", tz="UTC"),
++            pd.Timestamp(last, unit="ms", tz="UTC"),
++            int(count),
++        )
++
++    def updated_at(self, coin: str) -> Optional[float]:
++        with closing(self._connect()) as conn:
++            row = conn.execute("SELECT updated_at FROM coins WHERE coin = ?", (coin,)).fetchone()
++        return None if row is None else float(row[0])
++
++
++__all__ = ["TimeSeriesStore"]
+ 
+EOF
+)
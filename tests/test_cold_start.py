@@ -0,0 +1,59 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_cold_start.py
+index 0000000000000000000000000000000000000000..3fed1930233e228a66e7f8a20da49f0ec05c386d 100644
+--- a//dev/null
++++ b/tests/test_cold_start.py
+@@ -0,0 +1,50 @@
++import json
++import os
++import subprocess
++import sys
++from pathlib import Path
++
++import pandas as pd
++
++from core import charts
++
++REPO_ROOT = Path(__file__).resolve().parents[1]
++
++
++def _import_in_subprocess(cwd: Path) -> dict:
++    script = (
++        "import json, sys\n"
++        "import core.charts, core.compute, core.data_source\n"
++        "print(json.dumps({name: name in sys.modules for name in "
++        "['matplotlib.pyplot', 'requests']}))\n"
++    )
++    output = subprocess.check_output(
++        [sys.executable, "-c", script],
++        cwd=cwd,
++        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
++        text=True,
++    )
++    return json.loads(output)
++
++
++def test_core_import_is_lazy(tmp_path):
++    loaded = _import_in_subprocess(tmp_path)
++
++    assert loaded == {"matplotlib.pyplot": False, "requests": False}
++    assert not (tmp_path / "data").exists()
++    assert not (tmp_path / "exports").exists()
++
++
++def test_plot_save_creates_export_dir(tmp_path, monkeypatch):
++    export_dir = tmp_path / "exports"
++    monkeypatch.setattr(charts, "EXPORT_DIR", export_dir)
++    df = pd.DataFrame(
++        {
++            "date": pd.date_range("2020-01-01", periods=3, freq="D"),
++            "xrp_btc_ratio": [0.1, 0.2, 0.3],
++        }
++    )
++
++    charts.plot_ratio(df, save=True)
++
++    assert (export_dir / "02_ratio_xrp_btc.png").exists()
+ 
+EOF
+)
@@ -1,9 +1,9 @@
  (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
 diff --git a//dev/null b/tests/test_compute.py
-index 0000000000000000000000000000000000000000..a8ce48fdced4cccc43e6bb5cd4bee0402c7dce8a 100644
+index 0000000000000000000000000000000000000000..56e8d0bdc9930e54425e172946c16263364adbf9 100644
 --- a//dev/null
 +++ b/tests/test_compute.py
-@@ -0,0 +1,39 @@
+@@ -0,0 +1,89 @@
 +import math
 +
 +import numpy as np
@@ -43,6 +43,56 @@ index 0000000000000000000000000000000000000000..a8ce48fdced4cccc43e6bb5cd4bee040
 +
 +    assert abs(float(z_scores.mean())) < 1e-12
 +    assert math.isclose(float(z_scores.std(ddof=0)), 1.0, rel_tol=1e-9)
++
++
++def test_compute_ohlc_volume_and_vwap():
++    dates = pd.date_range("2020-01-06", periods=14, freq="D")
++    btc_prices = [float(100 + i) for i in range(14)]
++    xrp_prices = [float(1 + i / 10) for i in range(14)]
++    volumes = [float(10 * (i + 1)) for i in range(14)]
++    market_caps = [float(1000 + i) for i in range(14)]
++
++    df_btc = pd.DataFrame(
++        {
++            "date": dates,
++            "price": btc_prices,
++            "total_volume": volumes,
++            "market_cap": market_caps,
++        }
++    )
++    df_xrp = pd.DataFrame({"date": dates, "price": xrp_prices})
++
++    result, _ = compute(df_btc, df_xrp, frequency="W")
++
++    first_week = result.iloc[0]
++    assert first_week["btc_open"] == 100.0
++    assert first_week["btc_high"] == 106.0
++    assert first_week["btc_low"] == 100.0
++    assert first_week["btc_usd"] == 106.0
++    assert first_week["btc_volume"] == sum(volumes[:7])
++    assert first_week["btc_market_cap"] == market_caps[6]
++
++    units = np.divide(volumes, btc_prices)
++    expected_vwap = sum(volumes[:7]) / units[:7].sum()
++    assert math.isclose(first_week["btc_vwap"], expected_vwap, rel_tol=1e-12)
++    expected_cum = sum(volumes) / units.sum()
++    assert math.isclose(result["btc_vwap_cum"].iloc[-1], expected_cum, rel_tol=1e-12)
++
++    assert "xrp_volume" not in result.columns
++    assert "xrp_vwap" not in result.columns
++    assert not any(column.endswith("_units") for column in result.columns)
++
++
++def test_vwap_weights_by_units_traded():
++    dates = pd.date_range("2020-01-06", periods=2, freq="D")
++    # One coin traded each day, so the USD volume equals the price.
++    df_btc = pd.DataFrame({"date": dates, "price": [1.0, 100.0], "total_volume": [1.0, 100.0]})
++    df_xrp = pd.DataFrame({"date": dates, "price": [1.0, 1.0]})
++
++    result, _ = compute(df_btc, df_xrp, frequency="W")
++
++    assert math.isclose(result["btc_vwap"].iloc[0], 50.5, rel_tol=1e-12)
++    assert math.isclose(result["btc_vwap_cum"].iloc[0], 50.5, rel_tol=1e-12)
  
 EOF
 )
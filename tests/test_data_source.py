@@ -0,0 +1,65 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_data_source.py
+index 0000000000000000000000000000000000000000..0b7da4be2ab56d2d3884288b969cde25a436a5c2 100644
+--- a//dev/null
++++ b/tests/test_data_source.py
+@@ -0,0 +1,56 @@
++import json
++import math
++
++import pandas as pd
++
++from core import data_source
++from core.data_source import MarketChartResponse, fetch_market_chart
++
++DAY_MS = 86_400_000
++HOUR_MS = 3_600_000
++
++
++def test_from_json_keeps_market_caps_and_volumes():
++    payload = {
++        "prices": [[0, 1.0]],
++        "market_caps": [[0, None]],
++        "total_volumes": [[0, 5]],
++    }
++
++    chart = MarketChartResponse.from_json(payload)
++
++    assert chart.prices == [(0, 1.0)]
++    assert math.isnan(chart.market_caps[0][1])
++    assert chart.total_volumes == [(0, 5.0)]
++
++
++def test_fetch_market_chart_daily_ohlc_from_cache(tmp_path, monkeypatch):
++    monkeypatch.setattr(data_source, "CACHE_DIR", tmp_path)
++    payload = {
++        "prices": [[0, 10.0], [HOUR_MS, 12.0], [2 * HOUR_MS, 9.0], [DAY_MS, 11.0]],
++        "market_caps": [[0, 100.0], [2 * HOUR_MS, 90.0], [DAY_MS, 110.0]],
++        "total_volumes": [[0, 1.0], [2 * HOUR_MS, 3.0], [DAY_MS, 2.0]],
++    }
++    (tmp_path / "cache_testcoin.json").write_text(json.dumps(payload))
++
++    df = fetch_market_chart("testcoin")
++
++    assert list(df.columns) == data_source.DAILY_COLUMNS
++    assert df["date"].tolist() == list(pd.to_datetime([0, DAY_MS], unit="ms", utc=True))
++    first = df.iloc[0]
++    assert (first["open"], first["high"], first["low"], first["price"]) == (10.0, 12.0, 9.0, 9.0)
++    assert first["market_cap"] == 90.0
++    assert first["total_volume"] == 3.0
++
++
++def test_fetch_market_chart_prices_only_payload(tmp_path, monkeypatch):
++    monkeypatch.setattr(data_source, "CACHE_DIR", tmp_path)
++    payload = {"prices": [[0, 10.0], [DAY_MS, 11.0]]}
++    (tmp_path / "cache_testcoin.json").write_text(json.dumps(payload))
++
++    df = fetch_market_chart("testcoin")
++
++    assert df["price"].tolist() == [10.0, 11.0]
++    assert df["total_volume"].dtype == "float64"
++    assert df["total_volume"].isna().all()
++    assert df["market_cap"].isna().all()
+ 
+EOF
+)
@@ -0,0 +1,97 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_export.py
+index 0000000000000000000000000000000000000000..8b811f8990ce7c5a4e59410bb3e3e45263ae9804 100644
+--- a//dev/null
++++ b/tests/test_export.py
+@@ -0,0 +1,88 @@
++import builtins
++import zipfile
++
++import numpy as np
++import pandas as pd
++import pytest
++
++from core.export import write_columnar, write_csv, write_zip
++
++
++def _sample_frame(rows: int = 25) -> pd.DataFrame:
++    dates = pd.date_range("2020-01-01", periods=rows, freq="D")
++    return pd.DataFrame(
++        {
++            "date": dates.date,
++            "btc_usd": np.linspace(100.0, 200.0, rows),
++            "is_month_end": dates.is_month_end,
++        }
++    )
++
++
++def test_write_csv_chunked_matches_to_csv(tmp_path):
++    df = _sample_frame()
++    path = tmp_path / "series.csv"
++
++    write_csv(df, path, chunk_rows=4)
++
++    assert path.read_text(encoding="utf-8") == df.to_csv(index=False)
++
++
++def test_write_zip_streams_files_and_frames(tmp_path):
++    df = _sample_frame()
++    summary_path = tmp_path / "summary.txt"
++    summary_path.write_text("hello", encoding="utf-8")
++
++    zip_path = write_zip(
++        tmp_path / "out" / "artifacts.zip",
++        files={"summary.txt": summary_path},
++        frames={"series.csv": df},
++        chunk_rows=4,
++    )
++
++    with zipfile.ZipFile(zip_path) as archive:
++        assert archive.read("summary.txt") == b"hello"
++        assert archive.read("series.csv").decode("utf-8") == df.to_csv(index=False)
++    assert [p.name for p in zip_path.parent.iterdir()] == ["artifacts.zip"]
++
++
++def test_write_zip_removes_temp_file_on_error(tmp_path):
++    with pytest.raises(FileNotFoundError):
++        write_zip(tmp_path / "artifacts.zip", files={"missing.txt": tmp_path / "missing.txt"})
++
++    assert list(tmp_path.iterdir()) == []
++
++
++def test_write_columnar_npz_fallback(tmp_path, monkeypatch):
++    real_import = builtins.__import__
++
++    def _no_pyarrow(name, *args, **kwargs):
++        if name.startswith("pyarrow"):
++            raise ImportError(name)
++        return real_import(name, *args, **kwargs)
++
++    monkeypatch.setattr(builtins, "__import__", _no_pyarrow)
++    df = _sample_frame()
++
++    path = write_columnar(df, tmp_path / "series")
++
++    assert path.suffix == ".npz"
++    with np.load(path) as arrays:
++        assert np.allclose(arrays["btc_usd"], df["btc_usd"])
++        assert arrays["date"].dtype.kind == "M"
++        assert arrays["is_month_end"].tolist() == df["is_month_end"].tolist()
++
++
++@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
++def test_write_columnar_pyarrow_round_trip(tmp_path, fmt):
++    pytest.importorskip("pyarrow")
++    df = _sample_frame()
++
++    path = write_columnar(df, tmp_path / "series", fmt=fmt)
++
++    if fmt == "parquet":
++        loaded = pd.read_parquet(path)
++    else:
++        loaded = pd.read_feather(path)
++    assert np.allclose(loaded["btc_usd"], df["btc_usd"])
++    assert len(loaded) == len(df)
+ 
+EOF
+)
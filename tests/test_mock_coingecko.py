@@ -0,0 +1,40 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_mock_coingecko.py
+index 0000000000000000000000000000000000000000..b33a6a3983b8eec53c4e3310a0ac12fe64e07ed0 100644
+--- a//dev/null
++++ b/tests/test_mock_coingecko.py
+@@ -0,0 +1,31 @@
++import pytest
++
++from benchmarks.mock_coingecko import MockCoinGecko
++from core import data_source
++
++
++@pytest.fixture
++def patched_source(tmp_path, monkeypatch):
++    monkeypatch.setattr(data_source, "CACHE_DIR", tmp_path)
++    monkeypatch.setattr(data_source, "DEFAULT_SLEEP_SECONDS", 0.0)
++
++
++def test_fetch_market_chart_against_mock(patched_source, monkeypatch):
++    with MockCoinGecko(days=30) as mock:
++        monkeypatch.setattr(data_source, "API_URL_TEMPLATE", mock.url_template)
++        df = data_source.fetch_market_chart("bitcoin")
++        data_source.fetch_market_chart("bitcoin")
++
++    assert len(df) == 30
++    assert df["total_volume"].notna().all()
++    assert mock.stats.as_dict()["per_coin"] == {"bitcoin": 1}
++
++
++def test_mock_rate_limit_surfaces_as_error(patched_source, monkeypatch):
++    with MockCoinGecko(days=5, rate_limit_per_minute=1) as mock:
++        monkeypatch.setattr(data_source, "API_URL_TEMPLATE", mock.url_template)
++        data_source.fetch_market_chart("bitcoin")
++        with pytest.raises(RuntimeError, match="429"):
++            data_source.fetch_market_chart("ripple")
++
++    assert (mock.stats.ok, mock.stats.rate_limited) == (1, 1)
+ 
+EOF
+)
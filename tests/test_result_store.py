@@ -0,0 +1,128 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_result_store.py
+index 0000000000000000000000000000000000000000..1afddf2fb0e73939bea545b1e2ab417bbadeab75 100644
+--- a//dev/null
++++ b/tests/test_result_store.py
+@@ -0,0 +1,119 @@
++import sys
++import threading
++import time
++
++import numpy as np
++import pandas as pd
++import pytest
++
++from core.compute import compute
++from core.export import write_columnar, write_csv
++from core.result_store import ResultStore
++
++
++def _compute_sample():
++    dates = pd.date_range("2020-01-01", periods=30, freq="D")
++    df_btc = pd.DataFrame({"date": dates, "price": np.linspace(100.0, 130.0, 30)})
++    df_xrp = pd.DataFrame({"date": dates, "price": np.linspace(1.0, 1.6, 30)})
++    return compute(df_btc, df_xrp, frequency="D")
++
++
++def test_frame_is_zero_copy_and_read_only():
++    store = ResultStore()
++    result, summary = _compute_sample()
++    key = store.put("daily", result, summary)
++
++    first = store.frame(key)
++    second = store.frame(key)
++
++    assert np.shares_memory(first["btc_usd"].to_numpy(), second["btc_usd"].to_numpy())
++    pd.testing.assert_frame_equal(first, result, check_dtype=False)
++    with pytest.raises(ValueError):
++        first.loc[0, "btc_usd"] = 0.0
++    first["extra"] = 1.0
++    assert "extra" not in store.frame(key).columns
++    with pytest.raises(TypeError):
++        store.summary(key)["btc_cagr"] = 0.0
++
++
++def test_get_or_compute_runs_once_and_evicts_lru():
++    store = ResultStore(max_entries=2)
++    calls = []
++
++    def _compute():
++        calls.append(1)
++        return _compute_sample()
++
++    store.get_or_compute("a", _compute)
++    store.get_or_compute("a", _compute)
++    store.get_or_compute("b", _compute)
++    store.frame("a")
++    store.get_or_compute("c", _compute)
++
++    assert len(calls) == 3
++    assert "a" in store and "c" in store
++    assert "b" not in store
++    assert store.frame("b") is None
++
++
++def test_memory_usage_reports_entry_bytes():
++    store = ResultStore()
++    result, summary = _compute_sample()
++    store.put("daily", result, summary)
++
++    usage = store.memory_usage()
++
++    assert usage["rows"].tolist() == [len(result)]
++    assert usage["bytes"].iloc[0] == result.memory_usage(index=False, deep=True).sum()
++    assert store.total_bytes() == usage["bytes"].sum()
++
++
++def test_exports_read_store_frames(tmp_path, monkeypatch):
++    store = ResultStore()
++    result, summary = _compute_sample()
++    frame = store.frame(store.put("daily", result, summary))
++
++    write_csv(frame, tmp_path / "series.csv")
++    monkeypatch.setitem(sys.modules, "pyarrow", None)
++    path = write_columnar(frame, tmp_path / "series")
++
++    assert (tmp_path / "series.csv").read_text() == result.to_csv(index=False)
++    assert path.suffix == ".npz"
++
++
++def test_get_or_compute_deduplicates_concurrent_callers():
++    store = ResultStore()
++    calls = []
++    started = threading.Event()
++
++    def _slow_compute():
++        calls.append(1)
++        started.set()
++        time.sleep(0.2)
++        return _compute_sample()
++
++    threads = [
++        threading.Thread(target=store.get_or_compute, args=("daily", _slow_compute))
++        for _ in range(8)
++    ]
++    for thread in threads:
++        thread.start()
++    for thread in threads:
++        thread.join()
++
++    assert started.is_set()
++    assert len(calls) == 1
++    assert len(store) == 1
++
++
++def test_get_or_compute_retries_after_failure():
++    store = ResultStore()
++
++    def _failing_compute():
++        raise RuntimeError("boom")
++
++    with pytest.raises(RuntimeError):
++        store.get_or_compute("daily", _failing_compute)
++
++    assert store.get_or_compute("daily", _compute_sample) == "daily"
++    assert store.frame("daily") is not None
+ 
+EOF
+)
@@ -0,0 +1,160 @@
+ (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
+diff --git a//dev/null b/tests/test_timeseries_store.py
+index 0000000000000000000000000000000000000000..c6955bd9ff924ddb79ad4b851b0b3ec54f3ba6ca 100644
+--- a//dev/null
++++ b/tests/test_timeseries_store.py
+@@ -0,0 +1,151 @@
++import json
++from pathlib import Path
++
++import numpy as np
++import pandas as pd
++import pytest
++
++from core import data_source
++from core.compute import compute, compute_window
++from core.timeseries_store import TimeSeriesStore
++
++DAY_MS = 86_400_000
++
++
++def _daily_frame(start: str, periods: int, base: float) -> pd.DataFrame:
++    dates = pd.date_range(start, periods=periods, freq="D", tz="UTC")
++    prices = base * (1.0 + np.arange(periods) / 100.0)
++    return pd.DataFrame(
++        {
++            "date": dates,
++            "open": prices,
++            "high": prices * 1.01,
++            "low": prices * 0.99,
++            "price": prices,
++            "market_cap": prices * 1000.0,
++            "total_volume": np.arange(1, periods + 1, dtype=float),
++        }
++    )
++
++
++def test_bulk_ingest_and_range_query(tmp_path):
++    store = TimeSeriesStore(tmp_path / "ts.sqlite")
++    btc = _daily_frame("2020-01-01", 10, 100.0)
++    xrp = _daily_frame("2020-01-03", 10, 1.0)
++    xrp.loc[0, "market_cap"] = np.nan
++
++    assert store.ingest({"bitcoin": btc, "ripple": xrp}) == 20
++
++    window = store.query("bitcoin", pd.Timestamp("2020-01-04"), pd.Timestamp("2020-01-06"))
++    pd.testing.assert_frame_equal(window, btc.iloc[3:6].reset_index(drop=True))
++    assert np.isnan(store.query("ripple")["market_cap"].iloc[0])
++    assert store.coverage("ripple")[2] == 10
++    assert store.coverage("dogecoin") is None
++    assert store.query("dogecoin").empty
++
++
++def test_ingest_replaces_existing_rows(tmp_path):
++    store = TimeSeriesStore(tmp_path / "ts.sqlite")
++    btc = _daily_frame("2020-01-01", 3, 100.0)
++    store.ingest({"bitcoin": btc})
++    btc.loc[2, "price"] = 999.0
++    store.ingest({"bitcoin": btc})
++
++    stored = store.query("bitcoin")
++
++    assert len(stored) == 3
++    assert stored["price"].iloc[-1] == 999.0
++
++
++def _range_loader(frames, loaded):
++    def load_range(coins, start, end):
++        loaded.append((list(coins), start, end))
++        return {
++            coin: frames[coin][frames[coin]["date"] >= start].reset_index(drop=True)
++            if start is not None
++            else frames[coin]
++            for coin in coins
++        }
++
++    return load_range
++
++
++def test_store_path_survives_chdir(tmp_path, monkeypatch):
++    monkeypatch.chdir(tmp_path)
++    monkeypatch.setattr(data_source, "CACHE_DIR", Path("data"))
++    monkeypatch.setattr(data_source, "_stores", {})
++    store = data_source.get_timeseries_store()
++    store.ingest({"bitcoin": _daily_frame("2020-01-01", 3, 100.0)})
++
++    elsewhere = tmp_path / "elsewhere"
++    elsewhere.mkdir()
++    monkeypatch.chdir(elsewhere)
++
++    assert store.path == tmp_path / "data" / data_source.STORE_FILENAME
++    assert len(store.query("bitcoin")) == 3
++    assert data_source.get_timeseries_store() is not store
++
++
++def test_compute_window_loads_only_needed_range():
++    btc = _daily_frame("2020-01-01", 120, 100.0)
++    xrp = _daily_frame("2020-01-01", 120, 1.0)
++    loaded = []
++    load_range = _range_loader({"bitcoin": btc, "ripple": xrp}, loaded)
++
++    rebase = pd.Timestamp("2020-02-15")
++    result, summary = compute_window(load_range, frequency="M", rebase_date=rebase)
++    expected, expected_summary = compute(btc, xrp, frequency="M", rebase_date=rebase)
++
++    assert loaded == [(["bitcoin", "ripple"], pd.Timestamp("2020-02-01", tz="UTC"), None)]
++    pd.testing.assert_frame_equal(result, expected)
++    assert summary == expected_summary
++
++
++@pytest.mark.parametrize(
++    "frequency, window_start",
++    [
++        ("ME", "2020-02-01"),
++        ("MS", "2020-02-01"),
++        ("QE", "2020-01-01"),
++        ("W", "2020-02-10"),
++        ("D", "2020-02-15"),
++        ("2W", None),
++    ],
++)
++def test_compute_window_matches_full_history(frequency, window_start):
++    btc = _daily_frame("2019-11-01", 240, 100.0)
++    xrp = _daily_frame("2019-11-01", 240, 1.0)
++    loaded = []
++    load_range = _range_loader({"bitcoin": btc, "ripple": xrp}, loaded)
++
++    rebase = pd.Timestamp("2020-02-15")
++    result, summary = compute_window(load_range, frequency=frequency, rebase_date=rebase)
++    expected, expected_summary = compute(btc, xrp, frequency=frequency, rebase_date=rebase)
++
++    expected_start = pd.Timestamp(window_start, tz="UTC") if window_start else None
++    assert loaded[0][1] == expected_start
++    pd.testing.assert_frame_equal(result, expected)
++    assert summary == expected_summary
++
++
++def test_load_market_data_syncs_once_and_filters(tmp_path, monkeypatch):
++    monkeypatch.setattr(data_source, "CACHE_DIR", tmp_path)
++    for coin in ("bitcoin", "ripple"):
++        payload = {"prices": [[i * DAY_MS, 1.0 + i] for i in range(10)]}
++        (tmp_path / f"cache_{coin}.json").write_text(json.dumps(payload))
++    calls = []
++    fetch = data_source.fetch_market_chart
++
++    def counting_fetch(coin_id, **kwargs):
++        calls.append(coin_id)
++        return fetch(coin_id, **kwargs)
++
++    monkeypatch.setattr(data_source, "fetch_market_chart", counting_fetch)
++
++    start = pd.Timestamp(5 * DAY_MS, unit="ms", tz="UTC")
++    frames = data_source.load_market_data(["bitcoin", "ripple"], start=start)
++    data_source.load_market_data(["ripple"])
++
++    assert calls == ["bitcoin", "ripple"]
++    assert frames["bitcoin"]["price"].tolist() == [6.0, 7.0, 8.0, 9.0, 10.0]
++    assert list(frames["ripple"].columns) == data_source.DAILY_COLUMNS
+ 
+EOF
+)